@@ -1,105 +1,166 @@
-import argparse
+import contextlib
 import functools
-import json
+import os
 import platform
+import stat
 import sys
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Any
+from typing import TYPE_CHECKING, Any, Callable, TextIO, overload
 
-from rich.console import Console
-from rich.markdown import Markdown
+if TYPE_CHECKING:
+    import argparse
 
-console = Console()
+    from rich.console import Console
 
-parser = argparse.ArgumentParser(
-    description="Convert VSCode snippet files to Markdown format",
-    formatter_class=argparse.RawDescriptionHelpFormatter,
-    epilog="""
+__all__ = [
+    "SnippetError",
+    "SnippetProcessor",
+    "VSCodeSnippet",
+    "ls_snippets",
+    "main",
+]
+
+_ANSI_STYLES = {"error": "\033[1;31m", "warning": "\033[33m"}
+
+
+@functools.lru_cache(maxsize=1)
+def get_json_loads() -> Callable[[bytes], Any]:
+    try:
+        from orjson import loads
+    except ImportError:
+        from json import loads
+
+    return loads
+
+
+@functools.lru_cache(maxsize=1)
+def get_console() -> "Console":
+    from rich.console import Console
+
+    return Console()
+
+
+def print_stderr(message: str, style: str = "error") -> None:
+    if sys.stderr.isatty():
+        message = f"{_ANSI_STYLES[style]}{message}\033[0m"
+    sys.stderr.write(f"{message}\n")
+
+
+@functools.lru_cache(maxsize=1)
+def get_parser() -> "argparse.ArgumentParser":
+    import argparse
+
+    parser = argparse.ArgumentParser(
+        description="Convert VSCode snippet files to Markdown format",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
 Examples:
 %(prog)s -f snippets.json -l python
 %(prog)s -s '{"test": {"prefix": "t", "body": ["test"]}}' -l javascript
 %(prog)s -f my-snippets.json --snippet-path ~/.vscode/snippets -l python
     """,
-)
-# -s, --snippet
-parser.add_argument(
-    "-s",
-    "--snippet",
-    type=str,
-    required=False,
-    help="Target language for snippets",
-)
-# -ls, --list
-parser.add_argument(
-    "-ls",
-    "--list",
-    action="store_true",
-    help="List available snippets in the snippets directory",
-    default=False,
-)
-# -l, --language
-parser.add_argument(
-    "-l",
-    "--language",
-    type=str,
-    default="",
-    required=False,
-    help="Language identifier for Markdown code blocks (e.g., shellscript snippet for bash), defaults to snippet",
-)
-# -o, --output
-parser.add_argument(
-    "-o",
-    "--output",
-    type=Path,
-    help="Output file path (default: stdout)",
-    required=False,
-)
-# --print
-parser.add_argument(
-    "--print",
-    action="store_true",
-    help="Print the Markdown output to console instead of writing to a file",
-    default=False,
-)
-
-
-@functools.lru_cache(maxsize=1)
-def get_snippets_path() -> Path:
-    if platform.system() == "Linux":
-        return Path.home().joinpath(".config", "Code", "User", "snippets")
-    elif platform.system() == "Darwin":  # macOS
-        return Path.home().joinpath(
-            "Library", "Application Support", "Code", "User", "snippets"
-        )
-    elif platform.system() == "Windows":
-        return Path.home().joinpath("AppData", "Roaming", "Code", "User", "snippets")
-    else:
-        raise RuntimeError("Unsupported operating system for VSCode snippets path.")
+    )
+    # -s, --snippet
+    parser.add_argument(
+        "-s",
+        "--snippet",
+        type=str,
+        required=False,
+        help="Target language for snippets",
+    )
+    # -ls, --list
+    parser.add_argument(
+        "-ls",
+        "--list",
+        action="store_true",
+        help="List available snippets in the snippets directory",
+        default=False,
+    )
+    # -l, --language
+    parser.add_argument(
+        "-l",
+        "--language",
+        type=str,
+        default="",
+        required=False,
+        help="Language identifier for Markdown code blocks (e.g., shellscript snippet for bash), defaults to snippet",
+    )
+    # -o, --output
+    parser.add_argument(
+        "-o",
+        "--output",
+        type=Path,
+        help="Output file path, or output directory when used with --all",
+        required=False,
+    )
+    # --print
+    parser.add_argument(
+        "--print",
+        action="store_true",
+        help="Print the Markdown output to console instead of writing to a file",
+        default=False,
+    )
+    # --all
+    parser.add_argument(
+        "--all",
+        action="store_true",
+        help="Convert every snippet file in the snippets directory (--output is treated as a directory)",
+        default=False,
+    )
+
+    return parser
+
+
+_VSCODE_SNIPPET_DIRS: dict[str, tuple[str, ...]] = {
+    "Linux": (".config", "Code", "User", "snippets"),
+    "Darwin": ("Library", "Application Support", "Code", "User", "snippets"),
+    "Windows": ("AppData", "Roaming", "Code", "User", "snippets"),
+}
+
+try:
+    SNIPPETS_PATH: Path = Path.home().joinpath(
+        *_VSCODE_SNIPPET_DIRS[platform.system()]
+    )
+except KeyError:
+    raise RuntimeError(
+        "Unsupported operating system for VSCode snippets path."
+    ) from None
 
 
 class SnippetError(Exception):
     pass
 
 
-@dataclass
+NO_SNIPPETS_MD = "# No Snippets Found\n\nThe provided input contains no valid snippets."
+
+# fragments shared by every renderer so the output format lives in one place
+_MD_HEADING = "### "
+_MD_PREFIX = "\n **Prefix**: "
+_MD_DESCRIPTION = "\n\n**Description**: "
+_MD_TEMPLATE = "\n\n#### Template\n\n```"
+_MD_FENCE_END = "\n```"
+_MD_SEPARATOR = "\n\n---\n"
+
+
+@dataclass(slots=True, frozen=True)
 class VSCodeSnippet:
     name: str
     prefix: str
-    body: list[str]
+    body: tuple[str, ...] = ()
     description: str | None = None
 
     def to_markdown(self, language: str = "") -> str:
-        header = f"### {self.name}\n **Prefix**: {self.prefix}\n"
+        parts = [_MD_HEADING, self.name, _MD_PREFIX, str(self.prefix), "\n"]
 
-        description_section = "n/a"
         if self.description:
-            description_section = f"\n\n**Description**: {self.description}"
+            parts += (_MD_DESCRIPTION, str(self.description))
 
-        body_text = "\n".join(self.body)
-        code_block = f"\n\n#### Template\n\n```{language}\n{body_text}\n```"
+        parts += (_MD_TEMPLATE, language, "\n")
+        parts.append("\n".join(self.body))
+        parts.append(_MD_FENCE_END)
 
-        return f"{header}{description_section}{code_block}"
+        return "".join(parts)
 
     def __str__(self) -> str:
         return self.to_markdown()
@@ -114,8 +175,10 @@ class VSCodeSnippet:
         description = snippet_data.get("description")
 
         if isinstance(body, str):
-            body = [body]
-        elif not isinstance(body, list):
+            body = (body,)
+        elif isinstance(body, list):
+            body = tuple(body)
+        else:
             raise SnippetError(
                 f"Invalid body for snippet '{name}': expected string or array"
             )
@@ -128,119 +191,384 @@ class VSCodeSnippet:
         )
 
 
+def read_snippet_bytes(path: Path) -> bytes:
+    try:
+        return path.read_bytes()
+    except FileNotFoundError:
+        raise SnippetError(f"Snippet file not found: {path}") from None
+    except OSError as e:
+        raise SnippetError(f"Error reading snippet file '{path}': {e}")
+
+
+def decode_snippet_json(path: Path, data: bytes) -> Any:
+    try:
+        return get_json_loads()(data)
+    except ValueError as e:
+        raise SnippetError(f"Error reading snippet file '{path}': {e}")
+
+
+def read_snippet_json(path: Path) -> Any:
+    return decode_snippet_json(path, read_snippet_bytes(path))
+
+
+# mtime_ns and size are only part of the key, so an edited file is parsed again
+@functools.lru_cache(maxsize=32)
+def _load_snippets(path: Path, mtime_ns: int, size: int) -> tuple[VSCodeSnippet, ...]:
+    return tuple(SnippetProcessor.parse_snippet_json(read_snippet_json(path)))
+
+
 class SnippetProcessor:
-    def __init__(self, *, snippet_name: str, snippet_lang: str | None) -> None:
+    def __init__(
+        self,
+        *,
+        snippet_name: str,
+        snippet_lang: str | None,
+        snippet_path: Path | None = None,
+    ) -> None:
         self.snippet_name: str = snippet_name
         self.snippet_lang: str | None = snippet_lang
+        self._snippet_path: Path | None = snippet_path
 
-    def parse_snippet_json(self, json_data: dict[str, Any]) -> list[VSCodeSnippet]:
-        snippets: list[VSCodeSnippet] = []
+    @property
+    def snippet_path(self) -> Path:
+        if self._snippet_path is not None:
+            return self._snippet_path
+        return SNIPPETS_PATH.joinpath(f"{self.snippet_name.lower()}.json")
 
+    @staticmethod
+    def parse_snippet_json(json_data: dict[str, Any]) -> list[VSCodeSnippet]:
         if not isinstance(json_data, dict):
             raise SnippetError("Invalid JSON structure: expected object at root level")
 
+        # mirrors VSCodeSnippet.create inline, with builtins bound to locals
+        _isinstance, _dict, _list, _str, _tuple = isinstance, dict, list, str, tuple
+        snippet_cls = VSCodeSnippet
+        snippets: list[VSCodeSnippet] = []
+        append = snippets.append
+
         for name, snippet_data in json_data.items():
-            try:
-                snip = VSCodeSnippet.create(name, snippet_data)
-                snippets.append(snip)
-            except KeyError as e:
-                raise SnippetError(f"Missing required field in snippet '{name}': {e}")
+            if not _isinstance(snippet_data, _dict):
+                raise SnippetError(
+                    f"Invalid snippet data for '{name}': expected object"
+                )
+
+            body = snippet_data.get("body", [])
+            if _isinstance(body, _str):
+                body = (body,)
+            elif _isinstance(body, _list):
+                body = _tuple(body)
+            else:
+                raise SnippetError(
+                    f"Invalid body for snippet '{name}': expected string or array"
+                )
+
+            append(
+                snippet_cls(
+                    name,
+                    snippet_data.get("prefix", ""),
+                    body,
+                    snippet_data.get("description"),
+                )
+            )
 
         return snippets
 
+    def load_snippet_json(self) -> Any:
+        return read_snippet_json(self.snippet_path)
+
     def load_snippet_file(self) -> list[VSCodeSnippet]:
+        path = self.snippet_path
         try:
-            path = get_snippets_path().joinpath(f"{self.snippet_name.lower()}.json")
+            st = path.stat()
+        except OSError:
+            # nothing to key the cache on, let the read report the error
+            return self.parse_snippet_json(self.load_snippet_json())
 
-            if not path.exists():
-                raise SnippetError(f"Snippet file not found: {path}")
+        return list(_load_snippets(path, st.st_mtime_ns, st.st_size))
 
-            if not path.suffix.lower() == ".json":
-                raise SnippetError(f"File must be a JSON file: {path}")
+    @overload
+    def write_markdown(self, snippets: list[VSCodeSnippet]) -> str: ...
 
-            json_data = json.loads(path.read_text(encoding="utf-8"))
+    @overload
+    def write_markdown(self, snippets: list[VSCodeSnippet], out: TextIO) -> None: ...
 
-            return self.parse_snippet_json(json_data)
-        except Exception as e:
-            raise SnippetError(f"Error reading snippet file '{path}': {e}")
+    def write_markdown(
+        self, snippets: list[VSCodeSnippet], out: TextIO | None = None
+    ) -> str | None:
+        parts: list[str] = []
+        write = parts.append if out is None else out.write
 
-    def write_markdown(self, snippets: list[VSCodeSnippet]) -> str:
         if not snippets:
-            return (
-                "# No Snippets Found\n\nThe provided input contains no valid snippets."
-            )
+            write(NO_SNIPPETS_MD)
 
-        markdown_sections = []
+        language = self.snippet_lang or self.snippet_name
+        for index, snippet in enumerate(snippets):
+            if index:
+                write(_MD_SEPARATOR)
+            write(snippet.to_markdown(language=language))
 
-        for snippet in snippets:
-            markdown_sections.append(
-                snippet.to_markdown(language=self.snippet_lang or self.snippet_name)
-            )
+        return "".join(parts) if out is None else None
 
-        return "\n\n---\n".join(markdown_sections)
+    @overload
+    def render(self, json_data: dict[str, Any]) -> str: ...
 
+    @overload
+    def render(self, json_data: dict[str, Any], out: TextIO) -> None: ...
 
-def ls_snippets() -> list[str]:
-    snippets_path = get_snippets_path()
-    if not snippets_path.exists():
-        raise SnippetError(f"Snippets path does not exist: {snippets_path}")
+    def render(
+        self, json_data: dict[str, Any], out: TextIO | None = None
+    ) -> str | None:
+        if not isinstance(json_data, dict):
+            raise SnippetError("Invalid JSON structure: expected object at root level")
+
+        parts: list[str] = []
+        write = parts.append if out is None else out.write
+
+        if not json_data:
+            write(NO_SNIPPETS_MD)
+
+        language = self.snippet_lang or self.snippet_name
+        for index, (name, snippet_data) in enumerate(json_data.items()):
+            if not isinstance(snippet_data, dict):
+                raise SnippetError(
+                    f"Invalid snippet data for '{name}': expected object"
+                )
+
+            body = snippet_data.get("body", [])
+            if isinstance(body, list):
+                body = "\n".join(body)
+            elif not isinstance(body, str):
+                raise SnippetError(
+                    f"Invalid body for snippet '{name}': expected string or array"
+                )
+
+            if index:
+                write(_MD_SEPARATOR)
+
+            write(_MD_HEADING)
+            write(name)
+            write(_MD_PREFIX)
+            write(str(snippet_data.get("prefix", "")))
+            write("\n")
 
-    return [f.stem for f in snippets_path.glob("*.json") if f.is_file()]
+            description = snippet_data.get("description")
+            if description:
+                write(_MD_DESCRIPTION)
+                write(str(description))
 
+            write(_MD_TEMPLATE)
+            write(language)
+            write("\n")
+            write(body)
+            write(_MD_FENCE_END)
 
-def export_snippet_md(dest: str, snippet_md: str) -> int:
+        return "".join(parts) if out is None else None
+
+
+def snippet_files() -> list[Path]:
+    if not SNIPPETS_PATH.exists():
+        raise SnippetError(f"Snippets path does not exist: {SNIPPETS_PATH}")
+
+    return [f for f in SNIPPETS_PATH.glob("*.json") if f.is_file()]
+
+
+def ls_snippets() -> list[str]:
+    return [f.stem for f in snippet_files()]
+
+
+def export_snippet_md(dest: str | Path, snippet_md: str) -> int:
     try:
-        with Path(dest).open("w", encoding="utf-8") as f:
-            f.write(snippet_md)
+        data = memoryview(snippet_md.encode("utf-8"))
+        fd = os.open(dest, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o666)
+        try:
+            while data:
+                data = data[os.write(fd, data) :]
+        finally:
+            os.close(fd)
 
-        console.print(f"[green]Snippets exported to {dest}[/green]")
+        get_console().print(f"[green]Snippets exported to {dest}[/green]")
         return 0
     except Exception as e:
-        console.print(f"[red bold]Error exporting snippets: {e}[/red bold]")
+        print_stderr(f"Error exporting snippets: {e}")
     return 1
 
 
+def stream_snippet_md(
+    dest: str | Path, processor: SnippetProcessor, json_data: dict[str, Any]
+) -> int:
+    if not isinstance(json_data, dict):
+        raise SnippetError("Invalid JSON structure: expected object at root level")
+
+    # render next to dest and swap it in, so a failure never touches an existing file.
+    # Resolve first so a symlinked dest is written through like export_snippet_md
+    target = Path(dest).resolve()
+    tmp = target.with_name(f".{target.name}.{os.getpid()}.tmp")
+    try:
+        fd = os.open(tmp, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o666)
+    except OSError as e:
+        print_stderr(f"Error exporting snippets to {dest}: {e}")
+        return 1
+
+    try:
+        try:
+            with open(fd, "w", encoding="utf-8") as out:
+                processor.render(json_data, out)
+
+            # keep the permissions of the file being replaced
+            with contextlib.suppress(FileNotFoundError):
+                os.chmod(tmp, stat.S_IMODE(os.stat(target).st_mode))
+
+            os.replace(tmp, target)
+        except BaseException:
+            with contextlib.suppress(OSError):
+                tmp.unlink()
+            raise
+    except SnippetError:
+        raise
+    except Exception as e:
+        print_stderr(f"Error exporting snippets to {dest}: {e}")
+        return 1
+
+    get_console().print(f"[green]Snippets exported to {dest}[/green]")
+    return 0
+
+
+def _export_snippet_file(
+    processor: SnippetProcessor,
+    data: bytes,
+    *,
+    output_dir: Path | None,
+    print_md: bool,
+) -> int:
+    json_data = decode_snippet_json(processor.snippet_path, data)
+
+    dest = None
+    if output_dir:
+        dest = output_dir.joinpath(f"{processor.snippet_name}.md")
+
+    if not print_md:
+        return stream_snippet_md(dest, processor, json_data) if dest else 0
+
+    from rich.markdown import Markdown
+
+    markdown_content = processor.render(json_data)
+    get_console().print(Markdown(markdown_content, justify="full"))
+
+    return export_snippet_md(dest, markdown_content) if dest else 0
+
+
+def export_all_snippets(
+    *, snippet_lang: str | None, output_dir: Path | None, print_md: bool
+) -> int:
+    from collections import deque
+    from concurrent.futures import Future, ThreadPoolExecutor
+
+    # open the files glob found, snippet_name.lower() misses mixed-case names
+    processors = [
+        SnippetProcessor(snippet_name=f.stem, snippet_lang=snippet_lang, snippet_path=f)
+        for f in snippet_files()
+    ]
+
+    if output_dir:
+        output_dir.mkdir(parents=True, exist_ok=True)
+
+    exit_code = 0
+    max_workers = min(32, (os.cpu_count() or 1) + 4)
+    pending: deque[tuple[SnippetProcessor, Future[bytes]]] = deque()
+
+    def export_next() -> int:
+        processor, future = pending.popleft()
+        # report a broken file and carry on with the rest
+        try:
+            return _export_snippet_file(
+                processor, future.result(), output_dir=output_dir, print_md=print_md
+            )
+        except Exception as e:
+            print_stderr(f"Error: skipping {processor.snippet_path.name}: {e}")
+            return 1
+
+    # only the reads go to the pool, they release the GIL. Parsing and rendering
+    # stay on this thread, in order, with at most max_workers files read ahead
+    with ThreadPoolExecutor(max_workers) as pool:
+        for processor in processors:
+            future = pool.submit(read_snippet_bytes, processor.snippet_path)
+            pending.append((processor, future))
+            if len(pending) >= max_workers:
+                exit_code |= export_next()
+
+        while pending:
+            exit_code |= export_next()
+
+    return exit_code
+
+
+def print_snippet_list() -> None:
+    console = get_console()
+    console.print("[green]Available snippets:[/green]")
+    for snippet in ls_snippets():
+        console.print(f"- [blue]{snippet}[/blue]")
+
+
 def main() -> int:
-    args = parser.parse_args()
-    if not get_snippets_path().exists():
-        console.print(
-            "[red bold]Error:[/red bold] Snippets directory does not exist. "
+    # a bare --list is the most common invocation, skip building the parser for it
+    list_only = len(sys.argv) == 2 and sys.argv[1] in ("-ls", "--list")
+    args = None if list_only else get_parser().parse_args()
+    if args is not None and args.all and not (args.output or args.print):
+        get_parser().error("--all requires --output or --print")
+    if not SNIPPETS_PATH.exists():
+        print_stderr(
+            "Error: Snippets directory does not exist. "
             "Please ensure VSCode is installed and snippets are available."
         )
         return 1
     exit_code = 0
     try:
+        if args is None:
+            print_snippet_list()
+            return 0
+
         processor = SnippetProcessor(
             snippet_name=args.snippet,
             snippet_lang=args.language or None,
         )
         if args.list:
-            console.print("[green]Available snippets:[/green]")
-            for snippet in ls_snippets():
-                console.print(f"- [blue]{snippet}[/blue]")
+            print_snippet_list()
+
+        if args.all:
+            return export_all_snippets(
+                snippet_lang=args.language or None,
+                output_dir=args.output,
+                print_md=args.print,
+            )
 
         if not args.snippet:
             return 0
 
-        snippets = processor.load_snippet_file()
-        markdown_content = processor.write_markdown(snippets)
+        json_data = processor.load_snippet_json()
+        if args.output and not args.print:
+            # nothing else needs the document, write it out fragment by fragment
+            return stream_snippet_md(args.output, processor, json_data)
+
+        markdown_content = processor.render(json_data)
         if not markdown_content:
             raise SnippetError("No valid snippets found in the file.")
 
         if args.print:
-            console.print(Markdown(markdown_content, justify="full"))
+            from rich.markdown import Markdown
+
+            get_console().print(Markdown(markdown_content, justify="full"))
 
         if args.output:
             exit_code = export_snippet_md(args.output, markdown_content)
 
     except SnippetError as e:
-        console.print(f"[red bold]Error: {e}[/red bold]")
+        print_stderr(f"Error: {e}")
         exit_code = 1
     except KeyboardInterrupt:
-        console.print("\n[yellow]Closing program..[/yellow]")
+        print_stderr("\nClosing program..", style="warning")
         exit_code = 1
     except Exception as e:
-        console.print(f"[red bold]Unexpected error: {e}[/red bold]")
+        print_stderr(f"Unexpected error: {e}")
         exit_code = 1
 
     return exit_code
@@ -0,0 +1,91 @@
+import contextlib
+import io
+import os
+import stat
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+from main import SnippetError, SnippetProcessor, stream_snippet_md
+
+SNIPPETS = {"Function": {"prefix": "def", "body": ["def f(): ..."]}}
+
+
+class StreamSnippetMdTest(unittest.TestCase):
+    def setUp(self) -> None:
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+
+        self.dir = Path(tmp.name)
+        self.dest = self.dir.joinpath("python.md")
+        self.processor = SnippetProcessor(snippet_name="python", snippet_lang=None)
+
+    def export(self, json_data: object, dest: Path | None = None) -> int:
+        with contextlib.redirect_stdout(io.StringIO()), contextlib.redirect_stderr(
+            io.StringIO()
+        ):
+            return stream_snippet_md(dest or self.dest, self.processor, json_data)
+
+    def leftover_temp_files(self) -> list[str]:
+        return [p.name for p in self.dir.iterdir() if p.name.endswith(".tmp")]
+
+    def test_writes_the_rendered_document(self) -> None:
+        self.assertEqual(self.export(SNIPPETS), 0)
+        self.assertEqual(self.dest.read_text(), self.processor.render(SNIPPETS))
+        self.assertEqual(self.leftover_temp_files(), [])
+
+    def test_invalid_snippets_leave_existing_file_untouched(self) -> None:
+        for json_data in ([1], {"bad": {"body": 1}}, {"bad": {"body": ["x", 1]}}):
+            with self.subTest(json_data=json_data):
+                self.dest.write_text("keep")
+
+                with contextlib.suppress(SnippetError):
+                    self.assertEqual(self.export(json_data), 1)
+
+                self.assertEqual(self.dest.read_text(), "keep")
+                self.assertEqual(self.leftover_temp_files(), [])
+
+    @unittest.skipIf(sys.platform == "win32", "symlinks need extra privileges")
+    def test_writes_through_symlinks(self) -> None:
+        target = self.dir.joinpath("target.md")
+        target.write_text("old")
+        self.dest.symlink_to(target)
+
+        self.assertEqual(self.export(SNIPPETS), 0)
+
+        self.assertTrue(self.dest.is_symlink())
+        self.assertEqual(target.read_text(), self.processor.render(SNIPPETS))
+
+    @unittest.skipIf(sys.platform == "win32", "POSIX permissions")
+    def test_keeps_permissions_of_replaced_file(self) -> None:
+        self.dest.write_text("old")
+        self.dest.chmod(0o600)
+
+        self.assertEqual(self.export(SNIPPETS), 0)
+
+        self.assertEqual(stat.S_IMODE(self.dest.stat().st_mode), 0o600)
+
+    @unittest.skipIf(sys.platform == "win32", "POSIX permissions")
+    def test_new_files_follow_the_umask(self) -> None:
+        old_umask = os.umask(0o002)
+        try:
+            self.assertEqual(self.export(SNIPPETS), 0)
+        finally:
+            os.umask(old_umask)
+
+        self.assertEqual(stat.S_IMODE(self.dest.stat().st_mode), 0o664)
+
+    def test_does_not_remove_a_temp_file_it_did_not_create(self) -> None:
+        self.dest.write_text("keep")
+        foreign = self.dir.joinpath(f".python.md.{os.getpid()}.tmp")
+        foreign.write_text("not ours")
+
+        self.assertEqual(self.export(SNIPPETS), 1)
+
+        self.assertEqual(foreign.read_text(), "not ours")
+        self.assertEqual(self.dest.read_text(), "keep")
+
+
+if __name__ == "__main__":
+    unittest.main()
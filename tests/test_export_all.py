@@ -0,0 +1,83 @@
+import contextlib
+import io
+import json
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+import main
+
+GOOD_SNIPPETS = {"Function": {"prefix": "def", "body": ["def f(): ..."]}}
+
+
+class ExportAllTest(unittest.TestCase):
+    def setUp(self) -> None:
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+
+        self.snippets_dir = Path(tmp.name, "snippets")
+        self.snippets_dir.mkdir()
+        self.output_dir = Path(tmp.name, "docs")
+
+        patcher = mock.patch.object(main, "SNIPPETS_PATH", self.snippets_dir)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def add_snippet_file(self, name: str, content: str) -> None:
+        self.snippets_dir.joinpath(name).write_text(content, encoding="utf-8")
+
+    def export_all(self) -> tuple[int, str]:
+        stderr = io.StringIO()
+        with contextlib.redirect_stdout(io.StringIO()), contextlib.redirect_stderr(
+            stderr
+        ):
+            exit_code = main.export_all_snippets(
+                snippet_lang=None, output_dir=self.output_dir, print_md=False
+            )
+        return exit_code, stderr.getvalue()
+
+    def test_exports_every_file_including_mixed_case_names(self) -> None:
+        self.add_snippet_file("Python.json", json.dumps(GOOD_SNIPPETS))
+        self.add_snippet_file("go.json", json.dumps(GOOD_SNIPPETS))
+
+        exit_code, stderr = self.export_all()
+
+        self.assertEqual(exit_code, 0)
+        self.assertEqual(stderr, "")
+        self.assertEqual(
+            sorted(p.name for p in self.output_dir.iterdir()), ["Python.md", "go.md"]
+        )
+        self.assertIn("```Python\n", self.output_dir.joinpath("Python.md").read_text())
+
+    def test_broken_files_are_skipped_and_reported(self) -> None:
+        self.add_snippet_file("python.json", json.dumps(GOOD_SNIPPETS))
+        self.add_snippet_file("broken.json", "{not json")
+        self.add_snippet_file("invalid.json", json.dumps({"bad": {"body": 1}}))
+        self.add_snippet_file("items.json", json.dumps({"bad": {"body": ["x", 1]}}))
+
+        exit_code, stderr = self.export_all()
+
+        self.assertEqual(exit_code, 1)
+        self.assertEqual(
+            sorted(p.name for p in self.output_dir.iterdir()), ["python.md"]
+        )
+        for name in ("broken.json", "invalid.json"):
+            self.assertIn(f"skipping {name}", stderr)
+        self.assertIn("items.md", stderr)
+
+    def test_all_requires_output_or_print(self) -> None:
+        argv = ["main.py", "--all"]
+        with mock.patch.object(sys, "argv", argv), contextlib.redirect_stderr(
+            io.StringIO()
+        ) as stderr:
+            with self.assertRaises(SystemExit) as exited:
+                main.main()
+
+        self.assertEqual(exited.exception.code, 2)
+        self.assertIn("--all requires --output or --print", stderr.getvalue())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,92 @@
+import json
+import os
+import tempfile
+import unittest
+from pathlib import Path
+
+import main
+from main import SnippetError, SnippetProcessor, VSCodeSnippet
+
+INVALID_SNIPPETS = [
+    1,
+    "snippet",
+    ["body"],
+    {"prefix": "p", "body": 1},
+    {"prefix": "p", "body": {"line": "x"}},
+]
+
+
+class SnippetCacheTest(unittest.TestCase):
+    def setUp(self) -> None:
+        main._load_snippets.cache_clear()
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+
+        self.path = Path(tmp.name, "python.json")
+        self.write({"Function": {"prefix": "def", "body": ["def f(): ..."]}})
+        self.processor = SnippetProcessor(
+            snippet_name="python", snippet_lang=None, snippet_path=self.path
+        )
+
+    def write(self, json_data: dict) -> None:
+        self.path.write_text(json.dumps(json_data), encoding="utf-8")
+
+    def test_repeat_load_is_a_cache_hit(self) -> None:
+        first = self.processor.load_snippet_file()
+        second = self.processor.load_snippet_file()
+
+        self.assertEqual(main._load_snippets.cache_info().hits, 1)
+        self.assertIs(first[0], second[0])
+        self.assertIsNot(first, second)
+
+    def test_edited_file_is_parsed_again(self) -> None:
+        self.processor.load_snippet_file()
+        self.write({"Function": {"prefix": "fn", "body": ["def f(): ..."]}})
+
+        snippets = self.processor.load_snippet_file()
+
+        self.assertEqual(snippets[0].prefix, "fn")
+        self.assertEqual(main._load_snippets.cache_info().misses, 2)
+
+    def test_touched_file_with_same_size_is_parsed_again(self) -> None:
+        self.processor.load_snippet_file()
+        st = self.path.stat()
+        os.utime(self.path, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000))
+
+        self.processor.load_snippet_file()
+
+        self.assertEqual(main._load_snippets.cache_info().misses, 2)
+
+    def test_missing_file_raises_snippet_error(self) -> None:
+        self.path.unlink()
+
+        with self.assertRaisesRegex(SnippetError, "Snippet file not found"):
+            self.processor.load_snippet_file()
+
+
+class ValidationParityTest(unittest.TestCase):
+    def test_create_and_parse_snippet_json_agree_on_errors(self) -> None:
+        for snippet_data in INVALID_SNIPPETS:
+            with self.subTest(snippet_data=snippet_data):
+                with self.assertRaises(SnippetError) as created:
+                    VSCodeSnippet.create("bad", snippet_data)
+                with self.assertRaises(SnippetError) as parsed:
+                    SnippetProcessor.parse_snippet_json({"bad": snippet_data})
+
+                self.assertEqual(str(created.exception), str(parsed.exception))
+
+    def test_create_and_parse_snippet_json_agree_on_snippets(self) -> None:
+        json_data = {
+            "Line": {"prefix": "ln", "body": "single", "description": "d"},
+            "Lines": {"prefix": ["a", "b"], "body": ["x", "y"]},
+            "Empty": {},
+        }
+
+        self.assertEqual(
+            SnippetProcessor.parse_snippet_json(json_data),
+            [VSCodeSnippet.create(name, data) for name, data in json_data.items()],
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
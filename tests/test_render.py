@@ -0,0 +1,50 @@
+import io
+import unittest
+
+from main import SnippetProcessor
+
+SNIPPET_DOCUMENTS = [
+    {},
+    {"Function": {"prefix": "def", "body": ["def ${1:name}():", "\t..."]}},
+    {"Line": {"prefix": "ln", "body": "single line", "description": "A line"}},
+    {"Empty": {}},
+    {
+        "Arrays": {
+            "prefix": ["arr", "array"],
+            "body": ["l1", "l2"],
+            "description": ["d1", "d2"],
+        },
+        "Plain": {"prefix": "p", "body": []},
+    },
+]
+
+
+class RenderParityTest(unittest.TestCase):
+    def setUp(self) -> None:
+        self.processor = SnippetProcessor(snippet_name="python", snippet_lang=None)
+
+    def test_render_matches_write_markdown(self) -> None:
+        for json_data in SNIPPET_DOCUMENTS:
+            with self.subTest(json_data=json_data):
+                snippets = self.processor.parse_snippet_json(json_data)
+                self.assertEqual(
+                    self.processor.render(json_data),
+                    self.processor.write_markdown(snippets),
+                )
+
+    def test_streamed_output_matches_string_output(self) -> None:
+        for json_data in SNIPPET_DOCUMENTS:
+            with self.subTest(json_data=json_data):
+                snippets = self.processor.parse_snippet_json(json_data)
+
+                rendered = io.StringIO()
+                self.processor.render(json_data, rendered)
+                written = io.StringIO()
+                self.processor.write_markdown(snippets, written)
+
+                self.assertEqual(rendered.getvalue(), self.processor.render(json_data))
+                self.assertEqual(written.getvalue(), rendered.getvalue())
+
+
+if __name__ == "__main__":
+    unittest.main()